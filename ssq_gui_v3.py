@@ -7,12 +7,16 @@ Python 3.12 兼容 | 支持Windows打包
 import os
 import json
 import random
+import heapq
 import requests
 import threading
 import queue
 import logging
 from datetime import datetime, timedelta
-from collections import defaultdict
+from bisect import bisect
+from itertools import accumulate
+from functools import lru_cache
+from collections import Counter
 from enum import Enum
 from dataclasses import dataclass
 import tkinter as tk
@@ -60,6 +64,22 @@ class RecommendAlgorithm(Enum):
     def description(self):
         return self.value[1]
 
+
+# 算法详细说明
+_ALGO_DESC = {
+    RecommendAlgorithm.FREQUENCY_WEIGHTED: "频率加权+随机：按历史频率加权随机抽取",
+    RecommendAlgorithm.PURE_RANDOM: "纯随机：完全随机生成",
+    RecommendAlgorithm.PURE_FREQUENCY: "纯频率：只选最热门号码",
+    RecommendAlgorithm.HOT_COLD_BALANCE: "冷热平衡：3热+3冷",
+    RecommendAlgorithm.INTERVAL_DISTRIBUTION: "区间分布：确保覆盖不同区间",
+    RecommendAlgorithm.ODD_EVEN_BALANCE: "奇偶平衡：3奇+3偶",
+    RecommendAlgorithm.SUM_OPTIMIZED: "和值优化：控制和值在80-140",
+    RecommendAlgorithm.NO_CONSECUTIVE: "避免连号：无相邻号码"
+}
+
+# 下拉框显示名称 -> 算法
+_DESC_TO_ALGO = {algo.description: algo for algo in RecommendAlgorithm}
+
 # 消息类型枚举
 
 
@@ -85,22 +105,50 @@ def setup_logging():
 
 # ==================== 核心逻辑模块 ====================
 
+# 全部红球、蓝球号码
+_ALL_REDS = tuple(range(1, 34))
+_ALL_BLUES = tuple(range(1, 17))
+
 
 class SSQCore:
     """核心数据处理类 - 保持纯净，无UI依赖"""
 
+    # 复用HTTP连接（重复获取时免去TCP/TLS握手），首次请求时创建
+    _session = None
+
     @staticmethod
     def load_cached_data():
         """加载缓存数据"""
+        analysis = SSQCore.load_analysis()
+        if analysis is None:
+            return None
+        data = analysis[0]
+        logging.info(f"缓存有效: {len(data)}条")
+        return data
+
+    @staticmethod
+    def load_cache():
+        """加载完整缓存内容（含最新一期 latest）"""
+        snapshot = SSQCore._load_snapshot()
+        return snapshot[0] if snapshot else None
+
+    @staticmethod
+    def load_analysis():
+        """加载缓存数据及解析结果: (data, red_balls, blue_balls, red_freq, blue_freq)"""
+        snapshot = SSQCore._load_snapshot()
+        return snapshot[1] if snapshot else None
+
+    @staticmethod
+    def _load_snapshot():
+        """读取有效缓存快照: (cache, analysis)，无缓存或已过期返回None"""
         if not os.path.exists(AppConfig.CACHE_FILE):
             return None
         try:
-            with open(AppConfig.CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-            cache_time = datetime.fromisoformat(cache['timestamp'])
+            mtime = os.stat(AppConfig.CACHE_FILE).st_mtime_ns
+            snapshot = _load_cache_snapshot(mtime)
+            cache_time = datetime.fromisoformat(snapshot[0]['timestamp'])
             if datetime.now() - cache_time < timedelta(days=AppConfig.CACHE_EXPIRY_DAYS):
-                logging.info(f"缓存有效: {len(cache['data'])}条")
-                return cache['data']
+                return snapshot
         except Exception as e:
             logging.error(f"加载缓存失败: {e}")
         return None
@@ -113,14 +161,17 @@ class SSQCore:
                 {'red': item.get('red', ''), 'blue': item.get('blue', '')}
                 for item in data
             ]
+            # 只保留最新一期用于展示，不再重复存储完整原始数据
+            latest = {key: data[0].get(key, '')
+                      for key in ('code', 'date', 'red', 'blue')} if data else None
             cache = {
                 'timestamp': datetime.now().isoformat(),
                 'version': AppConfig.VERSION,
                 'data': simplified_data,
-                'raw_data': data
+                'latest': latest
             }
             with open(AppConfig.CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, ensure_ascii=False, indent=2)
+                json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
 
             count = len(simplified_data)
             logging.info(f"缓存成功: {count}条")
@@ -133,7 +184,9 @@ class SSQCore:
     def fetch_history_data():
         """从API获取历史数据"""
         try:
-            response = requests.get(
+            if SSQCore._session is None:
+                SSQCore._session = requests.Session()
+            response = SSQCore._session.get(
                 AppConfig.API_URL,
                 timeout=AppConfig.TIMEOUT)
             response.raise_for_status()
@@ -153,41 +206,64 @@ class SSQCore:
     @staticmethod
     def parse_numbers(data):
         """解析号码"""
-        red_balls, blue_balls = [], []
-        for item in data:
-            if 'red' in item and item['red']:
+        reds = [item['red'] for item in data
+                if item.get('red') and item['red'].count(',') == 5]
+        blues = [item['blue'] for item in data if item.get('blue')]
+        # 快速路径：拼接后一次性切分转换，避免逐条构建列表
+        try:
+            red_balls = list(map(int, ",".join(reds).split(','))) if reds else []
+        except ValueError:
+            red_balls = []
+            for red in reds:
                 try:
-                    nums = [int(x) for x in item['red'].split(',')]
-                    if len(nums) == 6:
-                        red_balls.extend(nums)
-                except BaseException:
+                    red_balls.extend([int(x) for x in red.split(',')])
+                except ValueError:
                     pass
-            if 'blue' in item and item['blue']:
+        try:
+            blue_balls = list(map(int, blues))
+        except ValueError:
+            blue_balls = []
+            for blue in blues:
                 try:
-                    blue_balls.append(int(item['blue']))
-                except BaseException:
+                    blue_balls.append(int(blue))
+                except ValueError:
                     pass
         return red_balls, blue_balls
 
     @staticmethod
     def analyze_frequency(red_balls, blue_balls):
-        """分析频率"""
-        red_freq = defaultdict(int)
-        blue_freq = defaultdict(int)
-        for num in red_balls:
-            if 1 <= num <= 33:
-                red_freq[num] += 1
-        for num in blue_balls:
-            if 1 <= num <= 16:
-                blue_freq[num] += 1
+        """分析频率，返回以号码为下标的计数列表（下标0不用）"""
+        # Counter 的计数在C层完成，再按号码展开为定长列表，越界号码自然忽略
+        red_counts = Counter(red_balls)
+        blue_counts = Counter(blue_balls)
+        red_freq = [0] + [red_counts[num] for num in _ALL_REDS]
+        blue_freq = [0] + [blue_counts[num] for num in _ALL_BLUES]
         return red_freq, blue_freq
 
+
+@lru_cache(maxsize=1)
+def _load_cache_snapshot(mtime):
+    """读取并解析缓存文件，以修改时间为键复用结果（文件变化即失效）"""
+    with open(AppConfig.CACHE_FILE, 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    data = cache['data']
+    red_balls, blue_balls = SSQCore.parse_numbers(data)
+    red_freq, blue_freq = SSQCore.analyze_frequency(red_balls, blue_balls)
+    return cache, (data, red_balls, blue_balls, red_freq, blue_freq)
+
 # ==================== 推荐算法引擎 ====================
 
 
 class RecommendEngine:
     """推荐算法引擎"""
 
+    # 固定号码池（奇偶、三个区间）
+    _ODDS = tuple(range(1, 34, 2))
+    _EVENS = tuple(range(2, 34, 2))
+    _INT1 = tuple(range(1, 12))
+    _INT2 = tuple(range(12, 23))
+    _INT3 = tuple(range(23, 34))
+
     @staticmethod
     def generate(algorithm, red_freq, blue_freq, count=5):
         """根据算法生成推荐"""
@@ -218,82 +294,65 @@ class RecommendEngine:
     @staticmethod
     def _frequency_weighted(red_freq, blue_freq, count):
         recommendations = []
-        all_reds = list(range(1, 34))
-        all_blues = list(range(1, 17))
-
-        for _ in range(count):
-            red_weights = [
-                red_freq.get(
-                    num,
-                    1) +
-                random.uniform(
-                    0.1,
-                    1.0) for num in all_reds]
-            selected_reds = sorted(
-                list(set(random.choices(all_reds, weights=red_weights, k=6)))[:6])
-            while len(selected_reds) < 6:
-                candidate = random.randint(1, 33)
-                if candidate not in selected_reds:
-                    selected_reds.append(candidate)
-            selected_reds = sorted(selected_reds[:6])
-
-            blue_weights = [blue_freq.get(num, 1) for num in all_blues]
-            selected_blue = random.choices(
-                all_blues, weights=blue_weights, k=1)[0]
-
+        # 累积权重只需构建一次，逐次抽样用二分查找（逆CDF）
+        red_cum = list(accumulate(red_freq[num] or 1 for num in _ALL_REDS))
+        blue_cum = list(accumulate(blue_freq[num] or 1 for num in _ALL_BLUES))
+
+        # 蓝球整批一次抽取
+        selected_blues = random.choices(_ALL_BLUES, cum_weights=blue_cum, k=count)
+        red_groups = RecommendEngine._draw_weighted_reds(red_cum, count)
+        for selected_reds, selected_blue in zip(red_groups, selected_blues):
             recommendations.append(
                 {'red': selected_reds, 'blue': selected_blue})
         return recommendations
 
+    @staticmethod
+    def _draw_weighted_reds(red_cum, count):
+        """按累积权重抽取 count 组不重复红球，用位掩码去重，结果已升序"""
+        total = red_cum[-1]
+        rand = random.random
+        groups = []
+        for _ in range(count):
+            mask = 0
+            picked = 0
+            while picked < 6:
+                bit = 1 << bisect(red_cum, rand() * total)
+                if not mask & bit:
+                    mask |= bit
+                    picked += 1
+            groups.append([num for num in _ALL_REDS if mask >> (num - 1) & 1])
+        return groups
+
     @staticmethod
     def _pure_random(count):
         recommendations = []
         for _ in range(count):
-            reds = sorted(random.sample(range(1, 34), 6))
+            reds = sorted(random.sample(_ALL_REDS, 6))
             blue = random.randint(1, 16)
             recommendations.append({'red': reds, 'blue': blue})
         return recommendations
 
     @staticmethod
     def _pure_frequency(red_freq, blue_freq, count):
-        recommendations = []
-        top_reds = [
-            num for num,
-            _ in sorted(
-                red_freq.items(),
-                key=lambda x: x[1],
-                reverse=True)[
-                :6]]
-        top_reds = sorted(top_reds)
-        top_blue = sorted(
-            blue_freq.items(),
-            key=lambda x: x[1],
-            reverse=True)[0][0]
-
-        for _ in range(count):
-            recommendations.append({'red': top_reds, 'blue': top_blue})
-        return recommendations
+        # 各组结果相同，只计算一次并共享（调用方只读）
+        top_reds = sorted(heapq.nlargest(6, _ALL_REDS, key=red_freq.__getitem__))
+        top_blue = max(_ALL_BLUES, key=blue_freq.__getitem__)
+        return [{'red': top_reds, 'blue': top_blue}] * count
 
     @staticmethod
     def _hot_cold_balance(red_freq, blue_freq, count):
         recommendations = []
+        # 冷热号码在各组间不变，循环外一次升序排序同时取冷号（头）和热号（尾）
+        ranked = sorted(_ALL_REDS, key=red_freq.__getitem__)
+        hot = ranked[-10:]
+        cold = ranked[:10]
+        hot_blue = max(_ALL_BLUES, key=blue_freq.__getitem__)
+        cold_blue = min(_ALL_BLUES, key=blue_freq.__getitem__)
+
         for _ in range(count):
-            hot = sorted(
-                red_freq.items(),
-                key=lambda x: x[1],
-                reverse=True)[
-                :10]
-            cold = sorted(red_freq.items(), key=lambda x: x[1])[:10]
-
-            hot_selected = random.sample([x[0] for x in hot], 3)
-            cold_selected = random.sample([x[0] for x in cold], 3)
+            hot_selected = random.sample(hot, 3)
+            cold_selected = random.sample(cold, 3)
             selected_reds = sorted(hot_selected + cold_selected)
-
-            hot_blue = sorted(
-                blue_freq.items(),
-                key=lambda x: x[1],
-                reverse=True)[0][0]
-            cold_blue = sorted(blue_freq.items(), key=lambda x: x[1])[0][0]
             selected_blue = random.choice([hot_blue, cold_blue])
 
             recommendations.append(
@@ -304,9 +363,9 @@ class RecommendEngine:
     def _interval_distribution(red_freq, blue_freq, count):
         recommendations = []
         for _ in range(count):
-            interval1 = random.sample(range(1, 12), 2)
-            interval2 = random.sample(range(12, 23), 2)
-            interval3 = random.sample(range(23, 34), 2)
+            interval1 = random.sample(RecommendEngine._INT1, 2)
+            interval2 = random.sample(RecommendEngine._INT2, 2)
+            interval3 = random.sample(RecommendEngine._INT3, 2)
             selected_reds = sorted(interval1 + interval2 + interval3)
             selected_blue = random.choice(
                 [random.randint(1, 8), random.randint(9, 16)])
@@ -318,8 +377,8 @@ class RecommendEngine:
     def _odd_even_balance(red_freq, blue_freq, count):
         recommendations = []
         for _ in range(count):
-            odds = random.sample([x for x in range(1, 34) if x % 2 == 1], 3)
-            evens = random.sample([x for x in range(1, 34) if x % 2 == 0], 3)
+            odds = random.sample(RecommendEngine._ODDS, 3)
+            evens = random.sample(RecommendEngine._EVENS, 3)
             selected_reds = sorted(odds + evens)
             selected_blue = random.randint(1, 16)
             recommendations.append(
@@ -330,11 +389,21 @@ class RecommendEngine:
     def _sum_optimized(red_freq, blue_freq, count):
         recommendations = []
         for _ in range(count):
-            while True:
-                selected_reds = sorted(random.sample(range(1, 34), 6))
-                sum_value = sum(selected_reds)
-                if 80 <= sum_value <= 140:
-                    break
+            selected_reds = random.sample(_ALL_REDS, 6)
+            sum_value = sum(selected_reds)
+            # 和值越界时替换最小/最大号码向区间靠拢，避免整组重抽
+            while not 80 <= sum_value <= 140:
+                if sum_value < 80:
+                    old = min(selected_reds)
+                    new = random.choice(
+                        [n for n in range(old + 1, 34) if n not in selected_reds])
+                else:
+                    old = max(selected_reds)
+                    new = random.choice(
+                        [n for n in range(1, old) if n not in selected_reds])
+                selected_reds[selected_reds.index(old)] = new
+                sum_value += new - old
+            selected_reds.sort()
             selected_blue = random.randint(1, 16)
             recommendations.append(
                 {'red': selected_reds, 'blue': selected_blue})
@@ -344,15 +413,9 @@ class RecommendEngine:
     def _no_consecutive(red_freq, blue_freq, count):
         recommendations = []
         for _ in range(count):
-            while True:
-                selected_reds = sorted(random.sample(range(1, 34), 6))
-                has_consecutive = False
-                for i in range(len(selected_reds) - 1):
-                    if selected_reds[i + 1] - selected_reds[i] == 1:
-                        has_consecutive = True
-                        break
-                if not has_consecutive:
-                    break
+            # 从1-28中选6个后依次加0-5，一一对应所有无连号组合，无需拒绝重抽
+            picks = sorted(random.sample(range(1, 29), 6))
+            selected_reds = [num + i for i, num in enumerate(picks)]
             selected_blue = random.randint(1, 16)
             recommendations.append(
                 {'red': selected_reds, 'blue': selected_blue})
@@ -364,13 +427,25 @@ class RecommendEngine:
 class MessageQueue:
     """线程通信队列管理器"""
 
-    def __init__(self):
+    # 入队后通知UI线程的虚拟事件
+    EVENT_NAME = "<<QueueMsg>>"
+
+    def __init__(self, root=None):
         self.queue = queue.Queue()
+        self._root = root
 
     def send(self, msg_type: MessageType, data=None):
         """发送消息"""
         self.queue.put((msg_type, data))
         logging.debug(f"发送消息: {msg_type.value}")
+        root = self._root
+        if root is not None:
+            # when='tail' 将事件排入Tk事件队列，可从工作线程安全调用
+            try:
+                root.event_generate(self.EVENT_NAME, when='tail')
+            except (tk.TclError, RuntimeError):
+                # 窗口已关闭或主循环已退出
+                pass
 
     def receive(self):
         """接收消息（非阻塞）"""
@@ -382,16 +457,26 @@ class MessageQueue:
 
     def clear(self):
         """清空队列"""
-        while not self.queue.empty():
-            try:
-                self.queue.get_nowait()
-                self.queue.task_done()
-            except BaseException:
-                break
+        # 在队列内部锁下一次性清空，等价于逐条 get_nowait + task_done
+        with self.queue.mutex:
+            self.queue.queue.clear()
+            self.queue.unfinished_tasks = 0
+            self.queue.all_tasks_done.notify_all()
         logging.info("队列已清空")
 
+    def close(self):
+        """关闭：不再通知UI线程并清空队列"""
+        self._root = None
+        self.clear()
+
 # ==================== GUI界面模块 ====================
 
+# 推荐结果行模板（格式串只解析一次）
+_RESULT_LINE_FMT = "第{}组: 红球 [{:02d} {:02d} {:02d} {:02d} {:02d} {:02d}]  蓝球 [{:02d}]".format
+
+# 彩球号码字体
+_BALL_FONT = (AppConfig.FONT_FAMILY, 10, "bold")
+
 
 class SSQGUI:
     """图形界面类 - 负责UI展示和用户交互"""
@@ -402,8 +487,13 @@ class SSQGUI:
         self.root.geometry(AppConfig.WINDOW_SIZE)
         self.root.resizable(True, True)
 
-        # 初始化通信队列
-        self.message_queue = MessageQueue()
+        # 初始化通信队列（入队即触发UI处理，无需轮询）
+        self.message_queue = MessageQueue(self.root)
+        self.root.bind(MessageQueue.EVENT_NAME,
+                       lambda e: self.process_messages())
+
+        # 进度条动画状态（避免重复启动/停止）
+        self._progress_running = False
 
         # 初始化倒计时变量
         self.countdown_var = tk.StringVar(value="开奖倒计时: 计算中...")
@@ -417,9 +507,6 @@ class SSQGUI:
 
         # 启动倒计时更新
         self.update_countdown()
-
-        # 启动消息处理
-        self.process_messages()
         logging.info("GUI初始化完成")
 
     def update_countdown(self):
@@ -555,15 +642,28 @@ class SSQGUI:
         self.ball_frame = ttk.Frame(ball_container)
         self.ball_frame.pack(anchor=tk.W, fill=tk.X)
 
-        # 添加透明占位符保持最小高度
-        self.placeholder_ball = ttk.Label(
+        # 彩球画布：预建6红1蓝，刷新时只更新文字和显隐（固定高度，无需占位符）
+        self.ball_canvas = tk.Canvas(
             self.ball_frame,
-            text="○",  # 空心圆作为占位符
-            font=(AppConfig.FONT_FAMILY, 10),
-            foreground="#E0E0E0",  # 浅灰色，几乎看不见
-            padding=(8, 4)
-        )
-        self.placeholder_ball.pack(side=tk.LEFT, padx=2)
+            width=232,
+            height=28,
+            highlightthickness=0,
+            background=ttk.Style().lookup("TFrame", "background"))
+        self.ball_canvas.pack(side=tk.LEFT, padx=2)
+
+        self.ball_items = []
+        for i, color in enumerate(["red"] * 6 + ["blue"]):
+            x = 2 + i * 30 + (20 if color == "blue" else 0)
+            tag = f"ball{i}"
+            self.ball_canvas.create_oval(
+                x, 2, x + 24, 26, fill=color, outline=color,
+                state=tk.HIDDEN, tags=tag)
+            text_id = self.ball_canvas.create_text(
+                x + 12, 14, fill="white", font=_BALL_FONT,
+                state=tk.HIDDEN, tags=tag)
+            self.ball_items.append((tag, text_id))
+        self.ball_separator = self.ball_canvas.create_text(
+            189, 14, text="|", state=tk.HIDDEN)
 
         # 操作按钮
         button_frame = ttk.Frame(left_panel)
@@ -662,36 +762,29 @@ class SSQGUI:
 
     def get_algorithm_description(self, algorithm):
         """获取算法说明"""
-        descriptions = {
-            RecommendAlgorithm.FREQUENCY_WEIGHTED: "频率加权+随机：基于历史频率，加入随机扰动",
-            RecommendAlgorithm.PURE_RANDOM: "纯随机：完全随机生成",
-            RecommendAlgorithm.PURE_FREQUENCY: "纯频率：只选最热门号码",
-            RecommendAlgorithm.HOT_COLD_BALANCE: "冷热平衡：3热+3冷",
-            RecommendAlgorithm.INTERVAL_DISTRIBUTION: "区间分布：确保覆盖不同区间",
-            RecommendAlgorithm.ODD_EVEN_BALANCE: "奇偶平衡：3奇+3偶",
-            RecommendAlgorithm.SUM_OPTIMIZED: "和值优化：控制和值在80-140",
-            RecommendAlgorithm.NO_CONSECUTIVE: "避免连号：无相邻号码"
-        }
-        return descriptions.get(algorithm, "")
+        return _ALGO_DESC.get(algorithm, "")
 
     def on_algorithm_change(self, event):
         """算法选择变化"""
-        selected_desc = self.algorithm_var.get()
-        for algo in RecommendAlgorithm:
-            if algo.description == selected_desc:
-                description = self.get_algorithm_description(algo)
-                self.algo_desc_text.config(state=tk.NORMAL)
-                self.algo_desc_text.delete(1.0, tk.END)
-                self.algo_desc_text.insert(tk.END, description)
-                self.algo_desc_text.config(state=tk.DISABLED)
-                break
+        algo = _DESC_TO_ALGO.get(self.algorithm_var.get())
+        if algo:
+            description = self.get_algorithm_description(algo)
+            self._set_text(self.algo_desc_text, description)
 
     def check_cache_status(self):
         """检查缓存状态"""
-        data = SSQCore.load_cached_data()
-        if data:
-            self.cache_var.set(f"缓存: {len(data)}条（有效）")
+        cache = SSQCore.load_cache()
+        if cache:
+            self.cache_var.set(f"缓存: {len(cache['data'])}条（有效）")
             self.status_var.set("缓存可用，可直接生成推荐")
+            if cache.get('latest'):
+                try:
+                    self.show_latest_result([cache['latest']])
+                except Exception as e:
+                    # 缓存中最新一期格式异常时保持初始状态，不影响启动
+                    logging.error(f"展示最新一期失败: {e}")
+                    self._set_text(self.latest_result_text, "请先获取数据...")
+                    self.draw_balls([], [])
         else:
             self.cache_var.set("缓存: 无/过期")
             self.status_var.set("请先获取数据")
@@ -710,18 +803,11 @@ class SSQGUI:
             self.cache_var.set("缓存: 无/过期")
             self.status_var.set("缓存已清除，请重新获取")
 
-            self.result_text.config(state=tk.NORMAL)
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "点击【生成推荐】获取号码...")
-            self.result_text.config(state=tk.DISABLED)
+            self._set_text(self.result_text, "点击【生成推荐】获取号码...")
 
-            self.latest_result_text.config(state=tk.NORMAL)
-            self.latest_result_text.delete(1.0, tk.END)
-            self.latest_result_text.insert(tk.END, "请先获取数据...")
-            self.latest_result_text.config(state=tk.DISABLED)
+            self._set_text(self.latest_result_text, "请先获取数据...")
 
-            for widget in self.ball_frame.winfo_children():
-                widget.destroy()
+            self.draw_balls([], [])
 
             messagebox.showinfo("成功", "缓存已清除！")
             logging.info("缓存清除成功")
@@ -750,9 +836,14 @@ class SSQGUI:
             data, msg = SSQCore.fetch_history_data()
             if data:
                 success, cache_msg = SSQCore.save_data_to_cache(data)
-                self.message_queue.send(
-                    MessageType.FETCH_SUCCESS,
-                    f"{msg}\n{cache_msg}")
+                # 直接携带条数和最新一期，UI线程无需再读缓存文件
+                self.message_queue.send(MessageType.FETCH_SUCCESS, {
+                    'status_msg': msg,
+                    'cache_msg': cache_msg,
+                    'cached': success,
+                    'count': len(data),
+                    'latest': data[0],
+                })
             else:
                 self.message_queue.send(MessageType.FETCH_ERROR, msg)
         except Exception as e:
@@ -765,12 +856,7 @@ class SSQGUI:
             messagebox.showwarning("警告", "没有有效的缓存数据！")
             return
 
-        selected_desc = self.algorithm_var.get()
-        selected_algorithm = None
-        for algo in RecommendAlgorithm:
-            if algo.description == selected_desc:
-                selected_algorithm = algo
-                break
+        selected_algorithm = _DESC_TO_ALGO.get(self.algorithm_var.get())
 
         if not selected_algorithm:
             messagebox.showerror("错误", "请选择有效的推荐算法！")
@@ -789,10 +875,11 @@ class SSQGUI:
     def _generate_recommend_worker(self, algorithm):
         """推荐生成工作线程"""
         try:
-            data = SSQCore.load_cached_data()
-            red_balls, blue_balls = SSQCore.parse_numbers(data)
-            red_freq, blue_freq = SSQCore.analyze_frequency(
-                red_balls, blue_balls)
+            analysis = SSQCore.load_analysis()
+            if analysis is None:
+                self.message_queue.send(MessageType.ERROR, "没有有效的缓存数据！")
+                return
+            data, red_balls, blue_balls, red_freq, blue_freq = analysis
 
             recommendations = RecommendEngine.generate(
                 algorithm, red_freq, blue_freq)
@@ -803,10 +890,9 @@ class SSQGUI:
                 "=" * 40
             ]
 
-            for i, rec in enumerate(recommendations, 1):
-                red_str = " ".join(f"{num:02d}" for num in rec['red'])
-                result_lines.append(
-                    f"第{i}组: 红球 [{red_str}]  蓝球 [{rec['blue']:02d}]")
+            result_lines.extend(
+                _RESULT_LINE_FMT(i, *rec['red'], rec['blue'])
+                for i, rec in enumerate(recommendations, 1))
 
             result_lines.append("\n" + "=" * 40)
             result_lines.append("💡 提示：多次运行获取不同组合")
@@ -819,83 +905,63 @@ class SSQGUI:
             self.message_queue.send(MessageType.ERROR, f"生成失败: {str(e)}")
 
     def process_messages(self):
-        """处理消息队列（UI更新）"""
-        msg_type, content = self.message_queue.receive()
+        """处理消息队列（UI更新），每次触发都取完队列中的全部消息"""
+        while True:
+            msg_type, content = self.message_queue.receive()
+            if msg_type is None:
+                break
+            self._handle_message(msg_type, content)
 
-        if msg_type:
-            logging.info(f"处理消息: {msg_type.value}")
+    def _handle_message(self, msg_type, content):
+        """处理单条消息"""
+        logging.info(f"处理消息: {msg_type.value}")
 
-            try:
-                if msg_type == MessageType.FETCH_SUCCESS:
-                    lines = content.split('\n')
-                    status_msg = lines[0]
-                    cache_msg = lines[1] if len(lines) > 1 else ""
-
-                    self.status_var.set(status_msg)
-
-                    # 修复冒号问题
-                    try:
-                        with open(AppConfig.CACHE_FILE, 'r', encoding='utf-8') as f:
-                            cache = json.load(f)
-                        data_count = len(cache.get('data', []))
-                        self.cache_var.set(f"缓存: {data_count}条（有效）")
-                    except BaseException:
-                        if "缓存成功" in cache_msg:
-                            count = cache_msg.replace(
-                                "缓存成功:", "").replace(
-                                "条", "").strip()
-                            self.cache_var.set(f"缓存: {count}条（有效）")
-                        else:
-                            self.cache_var.set("缓存: 有效")
-
-                    # 展示最新一期
-                    try:
-                        with open(AppConfig.CACHE_FILE, 'r', encoding='utf-8') as f:
-                            cache = json.load(f)
-                        raw_data = cache.get('raw_data', [])
-                        if raw_data:
-                            self.show_latest_result(raw_data)
-                    except BaseException:
-                        data = SSQCore.load_cached_data()
-                        if data:
-                            self.show_latest_result(data)
-
-                    self._set_ui_busy(False)
-                    messagebox.showinfo("成功", content)
-                    logging.info("UI更新完成 - 获取数据成功")
-
-                elif msg_type == MessageType.FETCH_ERROR:
-                    self.status_var.set("获取失败")
-                    self._set_ui_busy(False)
-                    messagebox.showerror("错误", content)
-
-                elif msg_type == MessageType.RECOMMEND_SUCCESS:
-                    self.result_text.config(state=tk.NORMAL)
-                    self.result_text.delete(1.0, tk.END)
-                    self.result_text.insert(tk.END, content)
-                    self.result_text.config(state=tk.DISABLED)
-                    self.status_var.set("推荐生成完成")
-                    self._set_ui_busy(False)
-
-                elif msg_type == MessageType.ERROR:
-                    self.status_var.set("发生错误")
-                    self._set_ui_busy(False)
-                    messagebox.showerror("错误", content)
-
-                elif msg_type == MessageType.PROGRESS_START:
-                    self.progress.start(10)
-
-                elif msg_type == MessageType.PROGRESS_STOP:
-                    self.progress.stop()
-
-            except Exception as e:
-                logging.error(f"消息处理异常: {e}")
-                import traceback
-                traceback.print_exc()
+        try:
+            if msg_type == MessageType.FETCH_SUCCESS:
+                self.status_var.set(content['status_msg'])
+                if content['cached']:
+                    self.cache_var.set(f"缓存: {content['count']}条（有效）")
+
+                # 展示最新一期
+                self.show_latest_result([content['latest']])
+
+                self._set_ui_busy(False)
+                messagebox.showinfo(
+                    "成功", f"{content['status_msg']}\n{content['cache_msg']}")
+                logging.info("UI更新完成 - 获取数据成功")
+
+            elif msg_type == MessageType.FETCH_ERROR:
+                self.status_var.set("获取失败")
+                self._set_ui_busy(False)
+                messagebox.showerror("错误", content)
+
+            elif msg_type == MessageType.RECOMMEND_SUCCESS:
+                self._set_text(self.result_text, content)
+                self.status_var.set("推荐生成完成")
+                self._set_ui_busy(False)
+
+            elif msg_type == MessageType.ERROR:
+                self.status_var.set("发生错误")
                 self._set_ui_busy(False)
+                messagebox.showerror("错误", content)
+
+            elif msg_type == MessageType.PROGRESS_START:
+                self._start_progress()
+
+            elif msg_type == MessageType.PROGRESS_STOP:
+                self._stop_progress()
+
+        except Exception as e:
+            logging.error(f"消息处理异常: {e}")
+            import traceback
+            traceback.print_exc()
+            self._set_ui_busy(False)
 
-        # 继续监听
-        self.root.after(100, self.process_messages)
+    def _set_text(self, widget, content):
+        """替换只读文本框内容（replace 单次操作完成删除与插入）"""
+        widget.config(state=tk.NORMAL)
+        widget.replace("1.0", tk.END, content)
+        widget.config(state=tk.DISABLED)
 
     def _set_ui_busy(self, busy: bool):
         """设置UI忙碌状态"""
@@ -905,9 +971,21 @@ class SSQGUI:
         self.algo_combo.config(state=state)
 
         if busy:
-            self.progress.start(10)
+            self._start_progress()
         else:
+            self._stop_progress()
+
+    def _start_progress(self):
+        """启动进度条动画（已在运行则跳过，避免重置计时器）"""
+        if not self._progress_running:
+            self.progress.start(10)
+            self._progress_running = True
+
+    def _stop_progress(self):
+        """停止进度条动画"""
+        if self._progress_running:
             self.progress.stop()
+            self._progress_running = False
 
     def show_latest_result(self, data):
         """展示最新一期开奖结果"""
@@ -928,54 +1006,33 @@ class SSQGUI:
         reds = latest.get('red', '')
         blues = latest.get('blue', '')
 
-        red_list = [int(x) for x in reds.split(',')] if reds else []
+        red_list = list(map(int, reds.split(','))) if reds else []
         blue_list = [int(blues)] if blues else []
 
-        self.latest_result_text.config(state=tk.NORMAL)
-        self.latest_result_text.delete(1.0, tk.END)
-        self.latest_result_text.insert(tk.END, f"期号: {issue}  日期: {date}")
-        self.latest_result_text.config(state=tk.DISABLED)
+        self._set_text(self.latest_result_text, f"期号: {issue}  日期: {date}")
 
         self.draw_balls(red_list, blue_list)
 
     def draw_balls(self, red_list, blue_list):
-        """绘制彩色球体"""
-        for widget in self.ball_frame.winfo_children():
-            widget.destroy()
-
-        for num in red_list:
-            ball = tk.Label(
-                self.ball_frame,
-                text=f"{num:02d}",
-                font=(AppConfig.FONT_FAMILY, 10, "bold"),
-                bg="red",
-                fg="white",
-                width=3,
-                height=1,
-                relief="raised",
-                bd=2)
-            ball.pack(side=tk.LEFT, padx=2)
-
-        ttk.Label(self.ball_frame, text="  |  ").pack(side=tk.LEFT)
-
-        for num in blue_list:
-            ball = tk.Label(
-                self.ball_frame,
-                text=f"{num:02d}",
-                font=(AppConfig.FONT_FAMILY, 10, "bold"),
-                bg="blue",
-                fg="white",
-                width=3,
-                height=1,
-                relief="raised",
-                bd=2)
-            ball.pack(side=tk.LEFT, padx=2)
+        """绘制彩色球体（复用画布上预建的球，只更新号码和显隐）"""
+        # 6个红球位 + 1个蓝球位，缺号的位置为None（隐藏）
+        numbers = list(red_list[:6]) + [None] * (6 - len(red_list[:6]))
+        numbers.append(blue_list[0] if blue_list else None)
+        for (tag, text_id), num in zip(self.ball_items, numbers):
+            if num is None:
+                self.ball_canvas.itemconfigure(tag, state=tk.HIDDEN)
+            else:
+                self.ball_canvas.itemconfigure(text_id, text=f"{num:02d}")
+                self.ball_canvas.itemconfigure(tag, state=tk.NORMAL)
+        self.ball_canvas.itemconfigure(
+            self.ball_separator,
+            state=tk.NORMAL if red_list or blue_list else tk.HIDDEN)
 
     def on_closing(self):
         """安全关闭"""
         logging.info("程序关闭中...")
-        self.message_queue.clear()
-        self.progress.stop()
+        self.message_queue.close()
+        self._stop_progress()
         try:
             self.btn_fetch.config(state=tk.NORMAL)
             self.btn_recommend.config(state=tk.NORMAL)